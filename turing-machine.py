@@ -1,13 +1,85 @@
-import sys
-from collections import defaultdict
 from IPython.display import display, clear_output
 import ipywidgets as widgets
 
-# Set recursion limit higher for potentially long simulations
-sys.setrecursionlimit(2000)
-
 # --- 1. TURING MACHINE CLASS (Copied from turing_machine_simulator.py) ---
 
+# Moves are interned to small ints; MOVE_DELTA gives the head displacement for each id.
+# Delta entries carry the displacement itself, so a step moves the head with a single add.
+MOVE_IDS = {'L': 0, 'R': 1, 'N': 2}
+MOVE_DELTA = (-1, 1, 0)
+
+# Longest stretch of tape a scanning self-loop jumps over per step of the generated runner
+SCAN_WINDOW = 256
+
+# Trace for one verbose step: state and tape, then a caret right-aligned under the head cell
+STEP_FMT = "Step %d: State: %-6s | Tape: %s\n%21s | Head: %*s\n"
+
+# Outcomes reported by the step loops back to run()
+RUN_HALTED, RUN_STEP_LIMIT, RUN_NO_TRANSITION, RUN_OFF_TAPE, RUN_LOOP = range(5)
+
+# Loop detection is only switched on for runs allowed more steps than this.
+# Each loop compares the configuration (state, head, tape hash) against one saved at checkpoints
+# that double in spacing (Brent's method), so any cycle is caught within a few periods.
+# The tape hash is XOR of hash((2 * position, byte)) updated on every write that changes a symbol;
+# positions are doubled because CPython hashes -1 and -2 alike. It only screens candidates:
+# a loop is reported once the tape also matches a copy taken at the checkpoint.
+LOOP_CHECK_MIN_STEPS = 100
+
+# Numba is optional: when it is installed, non-verbose runs use a compiled core loop
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    def _simulate(tape, origin, head, state, lo, hi, steps, tape_hash, checkpoint,
+                  next_s, write_s, move_s, byte_sym, width, halt_count, max_steps):
+        """
+        Native core loop over the packed delta arrays.
+        
+        Stops on halt, a detected loop, a missing transition, the step limit or the tape edge.
+        """
+        saved_state, saved_head, saved_hash = -1, 0, 0
+        saved_tape = tape.copy()
+        while state >= halt_count:
+            if state == saved_state and head == saved_head and tape_hash == saved_hash:
+                if (tape == saved_tape).all():
+                    return state, head, lo, hi, steps, tape_hash, RUN_LOOP
+            if steps >= checkpoint:
+                saved_state, saved_head, saved_hash = state, head, tape_hash
+                saved_tape[:] = tape
+                checkpoint = 2 * steps + 1
+            if steps >= max_steps:
+                return state, head, lo, hi, steps, tape_hash, RUN_STEP_LIMIT
+            index = origin + head
+            if index < 0 or index >= tape.shape[0]:
+                return state, head, lo, hi, steps, tape_hash, RUN_OFF_TAPE
+            sym = tape[index]
+            entry = state * width + byte_sym[sym]
+            if next_s[entry] < 0:
+                return state, head, lo, hi, steps, tape_hash, RUN_NO_TRANSITION
+            if write_s[entry] != sym:
+                tape_hash ^= hash((2 * head, sym)) ^ hash((2 * head, write_s[entry]))
+                tape[index] = write_s[entry]
+            if head < lo:
+                lo = head
+            if head > hi:
+                hi = head
+            head += move_s[entry]
+            state = next_s[entry]
+            steps += 1
+        return state, head, lo, hi, steps, tape_hash, RUN_HALTED
+
+    # The on-disk cache needs a source file; code exec'd from a string compiles uncached instead
+    try:
+        _simulate = njit(cache=True)(_simulate)
+    except RuntimeError:
+        _simulate = njit(_simulate)
+else:
+    _simulate = None
+
+
 class TuringMachine:
     """
     A basic implementation of a deterministic single-tape Turing Machine.
@@ -21,8 +93,8 @@ class TuringMachine:
 
     def __init__(self, states, alphabet, transition_function, start_state, accept_state, reject_state, blank_symbol='B', description="Generic TM"):
         """Initializes the Turing Machine, adding a description for the app."""
-        self.states = states
-        self.alphabet = alphabet
+        self.states = frozenset(states)
+        self.alphabet = frozenset(alphabet)
         self.delta = transition_function
         self.current_state = start_state
         self.start_state = start_state
@@ -30,99 +102,417 @@ class TuringMachine:
         self.reject_state = reject_state
         self.blank_symbol = blank_symbol
         self.description = description
+
+        # Validate the declaration once here; the step loops then trust every delta entry
+        for symbol in self.alphabet | {blank_symbol}:
+            if len(symbol) != 1 or not symbol.isascii():
+                raise ValueError(f"Tape symbols must be single ASCII characters: {symbol!r}.")
+        for state in (start_state, accept_state, reject_state):
+            if state not in self.states:
+                raise ValueError(f"Unknown state: {state!r}.")
+        for (q, a), (q2, w, m) in transition_function.items():
+            for state in (q, q2):
+                if state not in self.states:
+                    raise ValueError(f"Unknown state in transition {(q, a)}: {state!r}.")
+            for symbol in (a, w):
+                if symbol not in self.alphabet:
+                    raise ValueError(f"Unknown symbol in transition {(q, a)}: {symbol!r}.")
+            if m not in MOVE_IDS:
+                raise ValueError(f"Invalid move direction: {m!r}.")
+
+        # The blank's tape byte, encoded once for tape allocation and growth
+        self._blank = blank_symbol.encode('ascii')
         
-        # Tape is implemented as a dictionary for sparse storage
-        self.tape = defaultdict(lambda: self.blank_symbol)
+        # Tape is a dense bytearray; logical position 0 maps to index self.origin
+        self.tape = bytearray(self._blank * 64)
+        self.origin = 0
         self.head_position = 0
+        # Range of logical positions touched so far, maintained on every write
+        self._min_pos = 0
+        self._max_pos = -1
+        # Tape bytes standing in for non-ASCII input characters, mapped back for display
+        self._foreign = {}
+        self._foreign_cells = {}
         self.max_steps = 1000  # Safety limit
 
+        # Intern states and symbols to small ints and flatten delta into a table indexed by
+        # state_id * width + symbol_id. The extra column catches bytes outside the alphabet.
+        # Halting states take the lowest ids, so "still running" is the single test state >= _halt_count.
+        halting = tuple(dict.fromkeys((accept_state, reject_state)))
+        self._halt_count = len(halting)
+        self._state_names = halting + tuple(self.states.difference(halting))
+        self._state_id = {s: i for i, s in enumerate(self._state_names)}
+        self._sym_id = {c: i for i, c in enumerate(self.alphabet)}
+        self._width = len(self._sym_id) + 1
+        self._byte_sym = [len(self._sym_id)] * 256
+        for c, i in self._sym_id.items():
+            self._byte_sym[ord(c)] = i
+
+        # Self-loops that rewrite the symbol they read only scan across the tape. Each entry
+        # carries the bytes its state scans over in that direction so runs can skip the whole stretch.
+        scans = {}
+        for (q, a), (q2, w, m) in transition_function.items():
+            if (q2, w) == (q, a) and m != 'N':
+                scans[q, m] = scans.get((q, m), b'') + a.encode('ascii')
+
+        self._delta_table = [None] * (len(self._state_names) * self._width)
+        for (q, a), (q2, w, m) in transition_function.items():
+            index = self._state_id[q] * self._width + self._sym_id[a]
+            scan = scans.get((q, m)) if (q2, w) == (q, a) else None
+            self._delta_table[index] = (self._state_id[q2], ord(w), MOVE_DELTA[MOVE_IDS[m]], scan)
+
+        # The same table split into numpy arrays for the compiled loop; -1 marks a missing transition
+        if _simulate is not None:
+            self._next_s = np.full(len(self._delta_table), -1, dtype=np.int16)
+            self._write_s = np.zeros(len(self._delta_table), dtype=np.uint8)
+            self._move_s = np.zeros(len(self._delta_table), dtype=np.int8)
+            for index, entry in enumerate(self._delta_table):
+                if entry is not None:
+                    self._next_s[index], self._write_s[index], self._move_s[index] = entry[:3]
+            self._byte_sym_array = np.array(self._byte_sym, dtype=np.int16)
+        else:
+            self._runner = self._generate_runner()
+
     def _initialize_tape(self, input_string):
         """Resets the tape and head position with the new input string."""
-        self.tape.clear()
-        for i, symbol in enumerate(input_string):
-            self.tape[i] = symbol
+        # A quarter of the tape is left of the input and at least twice its length is right of it,
+        # which covers the bundled machines' movement without ever growing
+        size = max(64, 4 * len(input_string))
+        self.origin = size // 4
+        self.tape = bytearray(self._blank * size)
+        # Non-ASCII characters get private bytes from 128 up. No alphabet symbol uses those bytes,
+        # so they land in the unknown-symbol column and reject like any other foreign input.
+        # Past the 127th distinct character they share byte 255, and each such cell keeps its own
+        # character by position; reading one halts the run, so those cells are never overwritten.
+        encode_table = {}
+        self._foreign = {}
+        self._foreign_cells = {}
+        if not input_string.isascii():
+            for pos, c in enumerate(input_string):
+                if c.isascii():
+                    continue
+                byte = encode_table.get(ord(c))
+                if byte is None:
+                    byte = encode_table[ord(c)] = min(128 + len(self._foreign), 255)
+                    if byte < 255:
+                        self._foreign[byte] = c
+                if byte == 255:
+                    self._foreign_cells[pos] = c
+        encoded = input_string.translate(encode_table).encode('latin-1')
+        self.tape[self.origin:self.origin + len(input_string)] = encoded
+        # The first step always touches the start cell, even for empty input
+        self._min_pos = 0
+        self._max_pos = max(len(input_string), 1) - 1
         self.head_position = 0
         self.current_state = self.start_state
 
+    def _head_index(self):
+        """Returns the tape index under the head, growing the tape if needed."""
+        # The tape doubles on whichever end the head ran off. Growth builds a new bytearray
+        # rather than resizing in place, since the old one may still be exported to numpy.
+        index = self.origin + self.head_position
+        size = len(self.tape)
+        grow_left = grow_right = 0
+        while index < 0:
+            grow_left += size
+            index += size
+            size *= 2
+        while index >= size:
+            grow_right += size
+            size *= 2
+        if grow_left or grow_right:
+            self.tape = bytearray(self._blank * grow_left) + self.tape + self._blank * grow_right
+            self.origin += grow_left
+        return index
+
     def _get_current_symbol(self):
         """Reads the symbol at the current head position."""
-        return self.tape[self.head_position]
-
-    def _move_head(self, move):
-        """Updates the head position based on the move direction."""
-        if move == 'R':
-            self.head_position += 1
-        elif move == 'L':
-            self.head_position -= 1
-        elif move == 'N':
-            pass
-        else:
-            # Should not happen with valid Delta
-            raise ValueError(f"Invalid move direction: {move}.")
+        # Cells off the allocated tape read as blank without growing it
+        index = self.origin + self.head_position
+        if 0 <= index < len(self.tape):
+            byte = self.tape[index]
+            if byte == 255:
+                return self._foreign_cells[self.head_position]
+            return self._foreign.get(byte) or chr(byte)
+        return self.blank_symbol
+
+    def _decode(self, raw, start):
+        """Converts tape bytes back to text, restoring non-ASCII input characters."""
+        # start is the logical position of raw[0], used to place cells sharing byte 255
+        text = raw.decode('latin-1')
+        if not self._foreign:
+            return text
+        text = text.translate(self._foreign)
+        if self._foreign_cells and '\xff' in text:
+            chars = list(text)
+            for pos, c in self._foreign_cells.items():
+                if 0 <= pos - start < len(chars):
+                    chars[pos - start] = c
+            text = ''.join(chars)
+        return text
 
     def _get_tape_string(self):
         """Converts the active part of the tape to a readable string."""
-        if not self.tape:
-            return self.blank_symbol
-        
-        min_pos = min(self.tape.keys()) if self.tape else 0
-        max_pos = max(self.tape.keys()) if self.tape else 0
-
         # Ensure the head position is included in the visualized range
-        tape_start = min(min_pos, self.head_position)
-        tape_end = max(max_pos, self.head_position) + 1
+        tape_start = min(self._min_pos, self.head_position)
+        tape_end = max(self._max_pos, self.head_position) + 1
         
-        tape_list = [self.tape[i] for i in range(tape_start, tape_end)]
+        # Only the head can sit off the allocated tape; pad it as blank instead of growing the tape
+        start, end = self.origin + tape_start, self.origin + tape_end
+        tape_string = self._decode(self.tape[max(start, 0):max(end, 0)], max(start, 0) - self.origin)
+        if start < 0:
+            tape_string = self.blank_symbol * -start + tape_string
+        tape_string = tape_string.ljust(tape_end - tape_start, self.blank_symbol)
         
         # Calculate offset for the head marker
         head_offset = self.head_position - tape_start
         
-        return "".join(tape_list), head_offset, tape_start
-
-    def run(self, input_string, output_callback):
-        """Simulates the TM and sends output to the provided callback function."""
-        self._initialize_tape(input_string)
-        output_callback(f"--- Starting TM Simulation on Input: '{input_string}' ({self.description}) ---\n")
-
+        return tape_string, head_offset, tape_start
+
+    def _run_interpreted(self, log):
+        """Runs the generic Python step loop, appending a trace line per step to the log."""
+        # Hoist hot attributes into locals; they are written back once the loop exits
+        tape = self.tape
+        origin = self.origin
+        table = self._delta_table
+        byte_sym = self._byte_sym
+        width = self._width
+        state_names = self._state_names
+        decode = self._decode
+        max_steps = self.max_steps
+        halt_count = self._halt_count
+        state = self._state_id[self.current_state]
+        head = self.head_position
+        lo, hi = self._min_pos, self._max_pos
         step_count = 0
+        outcome = RUN_HALTED
+        tape_hash = 0
+        saved_state, saved_head, saved_hash, saved_tape = -1, 0, 0, None
+        checkpoint = 0 if max_steps > LOOP_CHECK_MIN_STEPS else max_steps
         
-        while self.current_state not in {self.accept_state, self.reject_state}:
-            if step_count >= self.max_steps:
-                output_callback(f"\n--- Simulation Halted (Max Steps: {self.max_steps} reached) ---\n")
-                return f"Halted (Max Steps) - State: {self.current_state}"
+        while state >= halt_count:
+            if state == saved_state and head == saved_head and tape_hash == saved_hash and tape == saved_tape:
+                outcome = RUN_LOOP
+                break
+            if step_count >= checkpoint:
+                saved_state, saved_head, saved_hash, saved_tape = state, head, tape_hash, bytes(tape)
+                checkpoint = 2 * step_count + 1
 
-            current_symbol = self._get_current_symbol()
-            transition_key = (self.current_state, current_symbol)
+            if step_count >= max_steps:
+                outcome = RUN_STEP_LIMIT
+                break
+
+            index = origin + head
+            if index < 0 or index >= len(tape):
+                self.head_position = head
+                index = self._head_index()
+                tape = self.tape
+                origin = self.origin
+            sym = tape[index]
+            entry = table[state * width + byte_sym[sym]]
             
-            if transition_key not in self.delta:
-                output_callback(f"Step {step_count}: No transition found for {transition_key}. Rejecting.\n")
-                self.current_state = self.reject_state
+            if entry is None:
+                outcome = RUN_NO_TRANSITION
                 break
             
-            next_state, write_symbol, move = self.delta[transition_key]
+            next_state, write_byte, move, _ = entry
 
             # 1. Prepare and Display step information
-            tape_string, head_offset, tape_start = self._get_tape_string()
+            tape_start = lo if lo < head else head
+            tape_end = (hi if hi > head else head) + 1
+            tape_string = decode(tape[origin + tape_start:origin + tape_end], tape_start)
+            head_offset = head - tape_start
             
-            output_callback(f"Step {step_count}: State: {self.current_state:<6} | Tape: {tape_string}\n")
-            output_callback(f"{'':<21} | Head: {' ' * head_offset + '^'}\n")
+            log.append(STEP_FMT % (step_count, state_names[state], tape_string, '', head_offset + 1, '^'))
             
             # 2. Update tape
-            self.tape[self.head_position] = write_symbol
+            if write_byte != sym:
+                tape_hash ^= hash((2 * head, sym)) ^ hash((2 * head, write_byte))
+                tape[index] = write_byte
+            if head < lo:
+                lo = head
+            if head > hi:
+                hi = head
             
             # 3. Move head
-            self._move_head(move)
+            head += move
             
             # 4. Update state
-            self.current_state = next_state
+            state = next_state
             
             step_count += 1
+
+        self.current_state = state_names[state]
+        self.head_position = head
+        self._min_pos, self._max_pos = lo, hi
+        return step_count, outcome
+
+    def _generate_runner(self):
+        """
+        Builds a step loop specialised to this machine's delta with exec.
+        
+        Every non-halting state becomes an if/elif branch that tests the symbol byte directly,
+        with writes, moves and state changes emitted only where they change something, and
+        scanning self-loops jump over their whole run. Halting states fall through to the final else.
+        The head's new cell is folded into the used range as it moves; every step writes to the cell
+        it reads, so this matches tracking writes for anything the final tape shows.
+        """
+        lines = [
+            "def runner(tape, size, origin, head, state, lo, hi, steps, tape_hash, checkpoint, max_steps):",
+            "    saved_state, saved_head, saved_hash, saved_tape = -1, 0, 0, None",
+            "    while True:",
+            "        if state == saved_state and head == saved_head and tape_hash == saved_hash and tape == saved_tape:",
+            "            return state, head, lo, hi, steps, tape_hash, RUN_LOOP",
+            "        if steps >= checkpoint:",
+            "            saved_state, saved_head, saved_hash, saved_tape = state, head, tape_hash, bytes(tape)",
+            "            checkpoint = 2 * steps + 1",
+            "        index = origin + head",
+        ]
+        state_keyword = "if"
+        for state_id, name in enumerate(self._state_names):
+            if state_id < self._halt_count:
+                continue
+            lines += [
+                f"        {state_keyword} state == {state_id}:  # {name!r}",
+                "            if steps >= max_steps:",
+                "                return state, head, lo, hi, steps, tape_hash, RUN_STEP_LIMIT",
+                "            if index < 0 or index >= size:",
+                "                return state, head, lo, hi, steps, tape_hash, RUN_OFF_TAPE",
+                "            sym = tape[index]",
+            ]
+            state_keyword = "elif"
+            sym_keyword = "if"
+            for symbol, sym_id in self._sym_id.items():
+                entry = self._delta_table[state_id * self._width + sym_id]
+                if entry is None:
+                    continue
+                next_state, write_byte, move, scan = entry
+                lines.append(f"            {sym_keyword} sym == {ord(symbol)}:  # {symbol!r}")
+                sym_keyword = "elif"
+                if scan is not None and move > 0:
+                    lines += [
+                        "                window = tape[index:index + SCAN_WINDOW]",
+                        f"                run = min(len(window) - len(window.lstrip({scan!r})), max_steps - steps)",
+                        "                head += run",
+                        "                if head > hi:",
+                        "                    hi = head",
+                        "                steps += run",
+                    ]
+                    continue
+                if scan is not None:
+                    lines += [
+                        "                window = tape[max(index - SCAN_WINDOW + 1, 0):index + 1]",
+                        f"                run = min(len(window) - len(window.rstrip({scan!r})), max_steps - steps)",
+                        "                head -= run",
+                        "                if head < lo:",
+                        "                    lo = head",
+                        "                steps += run",
+                    ]
+                    continue
+                if write_byte != ord(symbol):
+                    lines += [
+                        f"                tape_hash ^= hash((2 * head, {ord(symbol)})) ^ hash((2 * head, {write_byte}))",
+                        f"                tape[index] = {write_byte}",
+                    ]
+                if move > 0:
+                    lines += ["                head += 1", "                if head > hi:", "                    hi = head"]
+                elif move < 0:
+                    lines += ["                head -= 1", "                if head < lo:", "                    lo = head"]
+                if next_state != state_id:
+                    lines.append(f"                state = {next_state}")
+                lines.append("                steps += 1")
+            no_transition = "return state, head, lo, hi, steps, tape_hash, RUN_NO_TRANSITION"
+            if sym_keyword == "if":
+                lines.append(f"            {no_transition}")
+            else:
+                lines += ["            else:", f"                {no_transition}"]
+        halted = "return state, head, lo, hi, steps, tape_hash, RUN_HALTED"
+        if state_keyword == "if":
+            lines.append(f"        {halted}")
+        else:
+            lines += ["        else:", f"            {halted}"]
+
+        namespace = {
+            'SCAN_WINDOW': SCAN_WINDOW,
+            'RUN_HALTED': RUN_HALTED,
+            'RUN_STEP_LIMIT': RUN_STEP_LIMIT,
+            'RUN_NO_TRANSITION': RUN_NO_TRANSITION,
+            'RUN_OFF_TAPE': RUN_OFF_TAPE,
+            'RUN_LOOP': RUN_LOOP,
+        }
+        exec(compile("\n".join(lines) + "\n", f"<runner: {self.description}>", "exec"), namespace)
+        return namespace['runner']
+
+    def _run_compiled(self):
+        """
+        Runs the non-verbose step loop.
+        
+        Uses the Numba kernel when available and the generated runner otherwise,
+        growing the tape whenever the head leaves it.
+        """
+        state = self._state_id[self.current_state]
+        head, lo, hi, step_count = self.head_position, self._min_pos, self._max_pos, 0
+        detect_loops = self.max_steps > LOOP_CHECK_MIN_STEPS
+        tape_hash = 0
+
+        while True:
+            # Loop detection restarts on each call; a real cycle stops growing the tape eventually
+            checkpoint = step_count if detect_loops else self.max_steps
+            if _simulate is not None:
+                tape_view = np.frombuffer(self.tape, dtype=np.uint8)
+                state, head, lo, hi, step_count, tape_hash, outcome = _simulate(
+                    tape_view, self.origin, head, state, lo, hi, step_count, tape_hash, checkpoint,
+                    self._next_s, self._write_s, self._move_s, self._byte_sym_array, self._width,
+                    self._halt_count, self.max_steps)
+            else:
+                state, head, lo, hi, step_count, tape_hash, outcome = self._runner(
+                    self.tape, len(self.tape), self.origin, head, state, lo, hi, step_count,
+                    tape_hash, checkpoint, self.max_steps)
+            if outcome != RUN_OFF_TAPE:
+                break
+            self.head_position = head
+            self._head_index()
+
+        self.current_state = self._state_names[state]
+        self.head_position = head
+        self._min_pos, self._max_pos = lo, hi
+        return step_count, outcome
+
+    def run(self, input_string, output_callback, verbose=True):
+        """
+        Simulates the TM and sends output to the provided callback function.
+        
+        Output is collected in a log and handed to the callback once at the end.
+        With verbose=False the per-step trace is skipped and only the summary is reported;
+        such runs use the Numba kernel if it is installed and the generated runner otherwise.
+        """
+        self._initialize_tape(input_string)
+        log = [f"--- Starting TM Simulation on Input: '{input_string}' ({self.description}) ---\n"]
+
+        if verbose:
+            step_count, outcome = self._run_interpreted(log)
+        else:
+            step_count, outcome = self._run_compiled()
+
+        if outcome == RUN_NO_TRANSITION:
+            transition_key = (self.current_state, self._get_current_symbol())
+            log.append(f"Step {step_count}: No transition found for {transition_key}. Rejecting.\n")
+            self.current_state = self.reject_state
+        elif outcome == RUN_STEP_LIMIT:
+            log.append(f"\n--- Simulation Halted (Max Steps: {self.max_steps} reached) ---\n")
+            output_callback("".join(log))
+            return f"Halted (Max Steps) - State: {self.current_state}"
+        elif outcome == RUN_LOOP:
+            log.append(f"\n--- Simulation Halted (Loop detected after {step_count} steps) ---\n")
+            output_callback("".join(log))
+            return f"Halted (Loop detected) - State: {self.current_state}"
         
         # Final result
         final_tape, _, _ = self._get_tape_string()
-        output_callback(f"\n--- Simulation Finished in {step_count} steps ---\n")
-        output_callback(f"Final State: {self.current_state}\n")
-        output_callback(f"Final Tape: {final_tape}\n")
+        log.append(f"\n--- Simulation Finished in {step_count} steps ---\n")
+        log.append(f"Final State: {self.current_state}\n")
+        log.append(f"Final Tape: {final_tape}\n")
+        output_callback("".join(log))
         
         if self.current_state == self.accept_state:
             return "Accepted"
@@ -142,7 +532,8 @@ Delta1 = {
     ('q0', '0'): ('q0', '0', 'R'),
     ('q0', 'B'): ('q_reject', 'B', 'N'),
 }
-tm_replace_one = TuringMachine(Q1, Sigma1, Delta1, 'q0', 'q_accept', 'q_reject', description="Replace First '1' with '0'")
+Desc1 = "Replace First '1' with '0'"
+Spec1 = (Q1, Sigma1, Delta1, 'q0', 'q_accept', 'q_reject')
 
 
 # Example 2: Accepts L = {a^n b^n | n >= 1}
@@ -170,7 +561,8 @@ Delta2 = {
     ('q3', 'a'): ('q_reject', 'a', 'N'),
     ('q3', 'b'): ('q_reject', 'b', 'N'),
 }
-tm_anbn = TuringMachine(Q2, Sigma2, Delta2, 'q0', 'q_accept', 'q_reject', description="Accepts L={a^n b^n}")
+Desc2 = "Accepts L={a^n b^n}"
+Spec2 = (Q2, Sigma2, Delta2, 'q0', 'q_accept', 'q_reject')
 
 
 # Example 3: Binary Incrementer (new example: input is a binary number, output is +1)
@@ -187,21 +579,37 @@ Delta3 = {
     ('q_carry', '0'): ('q_accept', '1', 'N'),  # 0 + carry = 1, done, halt
     ('q_carry', 'B'): ('q_accept', '1', 'N'),  # Blank + carry = 1, done, halt (e.g., empty string or 111 -> 1000)
 }
-tm_bin_increment = TuringMachine(Q3, Sigma3, Delta3, 'q0', 'q_accept', 'q_reject', description="Binary Incrementer (+1)")
+Desc3 = "Binary Incrementer (+1)"
+Spec3 = (Q3, Sigma3, Delta3, 'q0', 'q_accept', 'q_reject')
 
 
 # --- 3. APP SETUP ---
 
-TM_MAP = {
-    tm_replace_one.description: tm_replace_one,
-    tm_anbn.description: tm_anbn,
-    tm_bin_increment.description: tm_bin_increment
+# Machines are only built the first time they are selected; the specs are enough to list them
+TM_SPECS = {
+    Desc1: Spec1,
+    Desc2: Spec2,
+    Desc3: Spec3
+}
+TM_FACTORIES = {
+    desc: (lambda desc=desc, args=args: TuringMachine(*args, description=desc))
+    for desc, args in TM_SPECS.items()
 }
+_tm_cache = {}
+
+
+def get_tm(desc):
+    """Returns the machine for a description, constructing it on first use."""
+    tm = _tm_cache.get(desc)
+    if tm is None:
+        tm = _tm_cache[desc] = TM_FACTORIES[desc]()
+    return tm
+
 
 # Widgets
 tm_selector = widgets.Dropdown(
-    options=list(TM_MAP.keys()),
-    value=list(TM_MAP.keys())[0],
+    options=list(TM_SPECS.keys()),
+    value=list(TM_SPECS.keys())[0],
     description='Select TM:',
     style={'description_width': 'initial'}
 )
@@ -219,6 +627,12 @@ run_button = widgets.Button(
     tooltip='Start the Turing Machine simulation'
 )
 
+verbose_checkbox = widgets.Checkbox(
+    value=True,
+    description='Verbose (show every step)',
+    style={'description_width': 'initial'}
+)
+
 output_area = widgets.Output()
 
 
@@ -237,15 +651,15 @@ def run_simulation(button):
             return
 
         # Get the selected TM instance
-        tm_instance = TM_MAP[selected_tm_desc]
+        tm_instance = get_tm(selected_tm_desc)
         
-        # Define a print function for the TM to use the widget output
-        def output_printer(text):
-            print(text, end='')
+        # Buffer the TM's output so the widget receives a single print per run
+        buffer = []
 
         try:
-            result = tm_instance.run(input_str, output_printer)
-            print(f"\nFinal Verdict: {result}")
+            result = tm_instance.run(input_str, buffer.append, verbose=verbose_checkbox.value)
+            buffer.append(f"\nFinal Verdict: {result}\n")
+            print("".join(buffer), end='')
         except Exception as e:
             print(f"\n--- Simulation Error ---")
             print(f"An unexpected error occurred: {e}")
@@ -255,25 +669,23 @@ def run_simulation(button):
 run_button.on_click(run_simulation)
 
 
-# Initial suggested inputs for context
+# Initial suggested inputs for context: description -> (input value, placeholder)
+_INPUT_DEFAULTS = {
+    Desc1: ('00100', 'Example: 00100'),
+    Desc2: ('aabb', 'Example: aabb (Accepts) or aab (Rejects)'),
+    Desc3: ('101', 'Example: 101 (Output: 110)'),
+}
+
+
 def update_input_placeholder(change):
-    selected_tm_desc = change.new
-    if selected_tm_desc == tm_replace_one.description:
-        input_box.value = '00100'
-        input_box.placeholder = 'Example: 00100'
-    elif selected_tm_desc == tm_anbn.description:
-        input_box.value = 'aabb'
-        input_box.placeholder = 'Example: aabb (Accepts) or aab (Rejects)'
-    elif selected_tm_desc == tm_bin_increment.description:
-        input_box.value = '101'
-        input_box.placeholder = 'Example: 101 (Output: 110)'
+    input_box.value, input_box.placeholder = _INPUT_DEFAULTS[change.new]
 
 tm_selector.observe(update_input_placeholder, names='value')
 
 
 # Assemble the layout
 header = widgets.HTML(value="<h2 style='color: #1f77b4;'>Turing Machine Simulator</h2>")
-controls = widgets.VBox([tm_selector, input_box, run_button])
+controls = widgets.VBox([tm_selector, input_box, verbose_checkbox, run_button])
 app_layout = widgets.VBox([header, controls, output_area])
 
 # Display the app